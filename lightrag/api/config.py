@@ -6,7 +6,8 @@ import os
 import argparse
 import logging
 from dotenv import load_dotenv
-from lightrag.utils import get_env_value
+from lightrag.utils import get_env_value, check_storage_env_vars
+from lightrag.kg import verify_storage_implementation
 from lightrag.llm.binding_options import (
     GeminiEmbeddingOptions,
     GeminiLLMOptions,
@@ -31,12 +32,15 @@ from lightrag.constants import (
     DEFAULT_MIN_RERANK_SCORE,
     DEFAULT_FORCE_LLM_SUMMARY_ON_MERGE,
     DEFAULT_MAX_ASYNC,
+    DEFAULT_LLM_RPS,
     DEFAULT_SUMMARY_MAX_TOKENS,
     DEFAULT_SUMMARY_LENGTH_RECOMMENDED,
     DEFAULT_SUMMARY_CONTEXT_SIZE,
     DEFAULT_SUMMARY_LANGUAGE,
     DEFAULT_EMBEDDING_FUNC_MAX_ASYNC,
     DEFAULT_EMBEDDING_BATCH_NUM,
+    DEFAULT_EMBEDDING_COALESCE_WINDOW_MS,
+    DEFAULT_EMBEDDING_COALESCE_MAX_BATCH,
     DEFAULT_OLLAMA_MODEL_NAME,
     DEFAULT_OLLAMA_MODEL_TAG,
     DEFAULT_RERANK_BINDING,
@@ -332,6 +336,22 @@ def parse_args() -> argparse.Namespace:
         "LIGHTRAG_VECTOR_STORAGE", DefaultRAGStorageConfig.VECTOR_STORAGE
     )
 
+    # Fail fast on incompatible storages or missing storage environment variables
+    for storage_type, storage_name in (
+        ("KV_STORAGE", args.kv_storage),
+        ("VECTOR_STORAGE", args.vector_storage),
+        ("GRAPH_STORAGE", args.graph_storage),
+        ("DOC_STATUS_STORAGE", args.doc_status_storage),
+    ):
+        try:
+            verify_storage_implementation(storage_type, storage_name)
+            check_storage_env_vars(storage_name)
+        except ValueError as e:
+            parser.error(str(e))
+
+    # Get LLM_RPS (requests per second quota of LLM provider) from environment
+    args.llm_rps = get_env_value("LLM_RPS", DEFAULT_LLM_RPS, float)
+
     # Get MAX_PARALLEL_INSERT from environment
     args.max_parallel_insert = get_env_value("MAX_PARALLEL_INSERT", 2, int)
 
@@ -432,6 +452,14 @@ def parse_args() -> argparse.Namespace:
         "EMBEDDING_BATCH_NUM", DEFAULT_EMBEDDING_BATCH_NUM, int
     )
 
+    # Coalescing of concurrent embedding calls into shared upstream requests
+    args.embedding_coalesce_window_ms = get_env_value(
+        "EMBEDDING_COALESCE_WINDOW_MS", DEFAULT_EMBEDDING_COALESCE_WINDOW_MS, int
+    )
+    args.embedding_coalesce_max_batch = get_env_value(
+        "EMBEDDING_COALESCE_MAX_BATCH", DEFAULT_EMBEDDING_COALESCE_MAX_BATCH, int
+    )
+
     ollama_server_infos.LIGHTRAG_NAME = args.simulated_model_name
     ollama_server_infos.LIGHTRAG_TAG = args.simulated_model_tag
 
@@ -4,14 +4,17 @@ LightRAG FastAPI Server
 
 from fastapi import FastAPI, Depends, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.openapi.docs import (
     get_swagger_ui_html,
     get_swagger_ui_oauth2_redirect_html,
 )
 import os
+import atexit
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
 import uvicorn
 import pipmaster as pm
@@ -21,6 +24,8 @@ from pathlib import Path
 import configparser
 from ascii_colors import ASCIIColors
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.datastructures import Headers
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from lightrag.api.utils_api import (
@@ -33,11 +38,11 @@ from .config import (
     update_uvicorn_mode_config,
     get_default_host,
 )
-from lightrag.utils import get_env_value
+from lightrag.utils import get_env_value, rate_limit_async_func_call
 from lightrag import LightRAG, __version__ as core_version
 from lightrag.api import __api_version__
 from lightrag.types import GPTKeywordExtractionFormat
-from lightrag.utils import EmbeddingFunc
+from lightrag.utils import EmbeddingFunc, EmbeddingBatcher
 from lightrag.constants import (
     DEFAULT_LOG_MAX_BYTES,
     DEFAULT_LOG_BACKUP_COUNT,
@@ -154,6 +159,46 @@ class LLMConfigCache:
                 self.gemini_embedding_options = {}
 
 
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves streaming responses uncompressed
+
+    The gzip encoder buffers output until enough data accumulates, which would
+    hold back incremental NDJSON chunks. Responses are matched on content type,
+    like Starlette already does for text/event-stream, and sent as is.
+    """
+
+    STREAMING_CONTENT_TYPES = ("application/x-ndjson",)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        app = self.app
+        streaming_content_types = self.STREAMING_CONTENT_TYPES
+
+        async def app_with_stream_bypass(scope, receive, gzip_send):
+            target_send = gzip_send
+
+            async def route_send(message):
+                nonlocal target_send
+                if message["type"] == "http.response.start":
+                    content_type = Headers(raw=message["headers"]).get(
+                        "content-type", ""
+                    )
+                    if content_type.startswith(streaming_content_types):
+                        # Bypass the gzip responder for the whole response
+                        target_send = send
+                await target_send(message)
+
+            await app(scope, receive, route_send)
+
+        gzip = GZipMiddleware(
+            app_with_stream_bypass, self.minimum_size, self.compresslevel
+        )
+        await gzip(scope, receive, send)
+
+
 def check_frontend_build():
     """Check if frontend is built and optionally check if source is up-to-date
 
@@ -393,6 +438,9 @@ def create_app(args):
         "lifespan": lifespan,
     }
 
+    # Serialize JSON responses with orjson (much faster for large answers)
+    app_kwargs["default_response_class"] = ORJSONResponse
+
     # Configure Swagger UI parameters
     # Enable persistAuthorization and tryItOutEnabled for better user experience
     app_kwargs["swagger_ui_parameters"] = {
@@ -449,6 +497,9 @@ def create_app(args):
         allow_headers=["*"],
     )
 
+    # Compress larger responses such as query answers and graph data
+    app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1024)
+
     # Create combined auth dependency for all endpoints
     combined_auth = get_combined_auth_dependency(api_key)
 
@@ -459,6 +510,7 @@ def create_app(args):
         config_cache: LLMConfigCache, args, llm_timeout: int
     ):
         """Create optimized OpenAI LLM function with pre-processed configuration"""
+        from lightrag.llm.openai import openai_complete_if_cache
 
         async def optimized_openai_alike_model_complete(
             prompt,
@@ -467,8 +519,6 @@ def create_app(args):
             keyword_extraction=False,
             **kwargs,
         ) -> str:
-            from lightrag.llm.openai import openai_complete_if_cache
-
             keyword_extraction = kwargs.pop("keyword_extraction", None)
             if keyword_extraction:
                 kwargs["response_format"] = GPTKeywordExtractionFormat
@@ -496,6 +546,10 @@ def create_app(args):
         config_cache: LLMConfigCache, args, llm_timeout: int
     ):
         """Create optimized Azure OpenAI LLM function with pre-processed configuration"""
+        from lightrag.llm.azure_openai import azure_openai_complete_if_cache
+
+        api_key = os.getenv("AZURE_OPENAI_API_KEY", args.llm_binding_api_key)
+        api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview")
 
         async def optimized_azure_openai_model_complete(
             prompt,
@@ -504,8 +558,6 @@ def create_app(args):
             keyword_extraction=False,
             **kwargs,
         ) -> str:
-            from lightrag.llm.azure_openai import azure_openai_complete_if_cache
-
             keyword_extraction = kwargs.pop("keyword_extraction", None)
             if keyword_extraction:
                 kwargs["response_format"] = GPTKeywordExtractionFormat
@@ -523,8 +575,8 @@ def create_app(args):
                 system_prompt=system_prompt,
                 history_messages=history_messages,
                 base_url=args.llm_binding_host,
-                api_key=os.getenv("AZURE_OPENAI_API_KEY", args.llm_binding_api_key),
-                api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview"),
+                api_key=api_key,
+                api_version=api_version,
                 **kwargs,
             )
 
@@ -534,6 +586,7 @@ def create_app(args):
         config_cache: LLMConfigCache, args, llm_timeout: int
     ):
         """Create optimized Gemini LLM function with cached configuration"""
+        from lightrag.llm.gemini import gemini_complete_if_cache
 
         async def optimized_gemini_model_complete(
             prompt,
@@ -542,8 +595,6 @@ def create_app(args):
             keyword_extraction=False,
             **kwargs,
         ) -> str:
-            from lightrag.llm.gemini import gemini_complete_if_cache
-
             if history_messages is None:
                 history_messages = []
 
@@ -621,29 +672,31 @@ def create_app(args):
     ):
         """
         Create optimized embedding function with pre-processed configuration for applicable bindings.
-        Uses lazy imports for all bindings and avoids repeated configuration parsing.
+        The binding is resolved and its options are parsed once here, so each call
+        goes straight to the provider function without re-dispatching on configuration.
         """
+        try:
+            if binding == "lollms":
+                from lightrag.llm.lollms import lollms_embed
 
-        async def optimized_embedding_function(texts, embedding_dim=None):
-            try:
-                if binding == "lollms":
-                    from lightrag.llm.lollms import lollms_embed
-
+                async def optimized_embedding_function(texts, embedding_dim=None):
                     return await lollms_embed(
                         texts, embed_model=model, host=host, api_key=api_key
                     )
-                elif binding == "ollama":
-                    from lightrag.llm.ollama import ollama_embed
 
-                    # Use pre-processed configuration if available, otherwise fallback to dynamic parsing
-                    if config_cache.ollama_embedding_options is not None:
-                        ollama_options = config_cache.ollama_embedding_options
-                    else:
-                        # Fallback for cases where config cache wasn't initialized properly
-                        from lightrag.llm.binding_options import OllamaEmbeddingOptions
+            elif binding == "ollama":
+                from lightrag.llm.ollama import ollama_embed
+
+                # Use pre-processed configuration if available, otherwise fallback to dynamic parsing
+                if config_cache.ollama_embedding_options is not None:
+                    ollama_options = config_cache.ollama_embedding_options
+                else:
+                    # Fallback for cases where config cache wasn't initialized properly
+                    from lightrag.llm.binding_options import OllamaEmbeddingOptions
 
-                        ollama_options = OllamaEmbeddingOptions.options_dict(args)
+                    ollama_options = OllamaEmbeddingOptions.options_dict(args)
 
+                async def optimized_embedding_function(texts, embedding_dim=None):
                     return await ollama_embed(
                         texts,
                         embed_model=model,
@@ -651,46 +704,57 @@ def create_app(args):
                         api_key=api_key,
                         options=ollama_options,
                     )
-                elif binding == "azure_openai":
-                    from lightrag.llm.azure_openai import azure_openai_embed
 
+            elif binding == "azure_openai":
+                from lightrag.llm.azure_openai import azure_openai_embed
+
+                async def optimized_embedding_function(texts, embedding_dim=None):
                     return await azure_openai_embed(texts, model=model, api_key=api_key)
-                elif binding == "aws_bedrock":
-                    from lightrag.llm.bedrock import bedrock_embed
 
+            elif binding == "aws_bedrock":
+                from lightrag.llm.bedrock import bedrock_embed
+
+                async def optimized_embedding_function(texts, embedding_dim=None):
                     return await bedrock_embed(texts, model=model)
-                elif binding == "jina":
-                    from lightrag.llm.jina import jina_embed
 
+            elif binding == "jina":
+                from lightrag.llm.jina import jina_embed
+
+                async def optimized_embedding_function(texts, embedding_dim=None):
                     return await jina_embed(
                         texts,
                         embedding_dim=embedding_dim,
                         base_url=host,
                         api_key=api_key,
                     )
-                elif binding == "gemini":
-                    from lightrag.llm.gemini import gemini_embed
 
-                    # Use pre-processed configuration if available, otherwise fallback to dynamic parsing
-                    if config_cache.gemini_embedding_options is not None:
-                        gemini_options = config_cache.gemini_embedding_options
-                    else:
-                        # Fallback for cases where config cache wasn't initialized properly
-                        from lightrag.llm.binding_options import GeminiEmbeddingOptions
+            elif binding == "gemini":
+                from lightrag.llm.gemini import gemini_embed
+
+                # Use pre-processed configuration if available, otherwise fallback to dynamic parsing
+                if config_cache.gemini_embedding_options is not None:
+                    gemini_options = config_cache.gemini_embedding_options
+                else:
+                    # Fallback for cases where config cache wasn't initialized properly
+                    from lightrag.llm.binding_options import GeminiEmbeddingOptions
 
-                        gemini_options = GeminiEmbeddingOptions.options_dict(args)
+                    gemini_options = GeminiEmbeddingOptions.options_dict(args)
+                task_type = gemini_options.get("task_type", "RETRIEVAL_DOCUMENT")
 
+                async def optimized_embedding_function(texts, embedding_dim=None):
                     return await gemini_embed(
                         texts,
                         model=model,
                         base_url=host,
                         api_key=api_key,
                         embedding_dim=embedding_dim,
-                        task_type=gemini_options.get("task_type", "RETRIEVAL_DOCUMENT"),
+                        task_type=task_type,
                     )
-                else:  # openai and compatible
-                    from lightrag.llm.openai import openai_embed
 
+            else:  # openai and compatible
+                from lightrag.llm.openai import openai_embed
+
+                async def optimized_embedding_function(texts, embedding_dim=None):
                     return await openai_embed(
                         texts,
                         model=model,
@@ -698,8 +762,9 @@ def create_app(args):
                         api_key=api_key,
                         embedding_dim=embedding_dim,
                     )
-            except ImportError as e:
-                raise Exception(f"Failed to import {binding} embedding: {e}")
+
+        except ImportError as e:
+            raise Exception(f"Failed to import {binding} embedding: {e}")
 
         return optimized_embedding_function
 
@@ -708,6 +773,9 @@ def create_app(args):
         "EMBEDDING_TIMEOUT", DEFAULT_EMBEDDING_TIMEOUT, int
     )
 
+    # Use global temperature for Bedrock
+    bedrock_temperature = get_env_value("BEDROCK_LLM_TEMPERATURE", 1.0, float)
+
     async def bedrock_model_complete(
         prompt,
         system_prompt=None,
@@ -724,8 +792,7 @@ def create_app(args):
         if history_messages is None:
             history_messages = []
 
-        # Use global temperature for Bedrock
-        kwargs["temperature"] = get_env_value("BEDROCK_LLM_TEMPERATURE", 1.0, float)
+        kwargs["temperature"] = bedrock_temperature
 
         return await bedrock_complete_if_cache(
             args.llm_model,
@@ -777,6 +844,18 @@ def create_app(args):
         f"binding={args.embedding_binding})"
     )
 
+    # Merge concurrent embedding calls into shared upstream requests if enabled
+    if args.embedding_coalesce_window_ms > 0:
+        optimized_embedding_func = EmbeddingBatcher(
+            optimized_embedding_func,
+            max_batch_size=args.embedding_coalesce_max_batch,
+            flush_interval=args.embedding_coalesce_window_ms / 1000,
+        )
+        logger.info(
+            f"Embedding coalescing enabled: window={args.embedding_coalesce_window_ms}ms, "
+            f"max_batch={args.embedding_coalesce_max_batch}"
+        )
+
     # Create EmbeddingFunc with send_dimensions attribute
     embedding_func = EmbeddingFunc(
         embedding_dim=args.embedding_dim,
@@ -846,12 +925,20 @@ def create_app(args):
         name=args.simulated_model_name, tag=args.simulated_model_tag
     )
 
+    llm_model_func = create_llm_model_func(args.llm_binding)
+    # Throttle LLM calls for providers that enforce a requests-per-second quota
+    if args.llm_rps > 0:
+        llm_model_func = rate_limit_async_func_call(
+            args.llm_rps, burst=max(1, int(args.llm_rps))
+        )(llm_model_func)
+        logger.info(f"LLM rate limit enabled: {args.llm_rps} requests/second")
+
     # Initialize RAG with unified configuration
     try:
         rag = LightRAG(
             working_dir=args.working_dir,
             workspace=args.workspace,
-            llm_model_func=create_llm_model_func(args.llm_binding),
+            llm_model_func=llm_model_func,
             llm_model_name=args.llm_model,
             llm_model_max_async=args.max_async,
             summary_max_tokens=args.summary_max_tokens,
@@ -1196,6 +1283,26 @@ def configure_logging():
         }
     )
 
+    # Hand log records to a background thread so console and file I/O
+    # (including log rotation) never block the event loop
+    logger_names = ["uvicorn", "uvicorn.access", "uvicorn.error", "lightrag"]
+    handlers = []
+    for logger_name in logger_names:
+        for handler in logging.getLogger(logger_name).handlers:
+            if handler not in handlers:
+                handlers.append(handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    for logger_name in logger_names:
+        logging.getLogger(logger_name).handlers = [queue_handler]
+
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
 
 def check_and_install_dependencies():
     """Check and install required dependencies"""
@@ -3,9 +3,10 @@ This module contains all document-related routes for the LightRAG API.
 """
 
 import asyncio
+import hashlib
+import uuid
 from lightrag.utils import logger, get_pinyin_sort_key
 import aiofiles
-import shutil
 import traceback
 import pipmaster as pm
 from datetime import datetime, timezone
@@ -61,6 +62,19 @@ router = APIRouter(
 # Temporary file prefix
 temp_prefix = "__tmp__"
 
+# Chunk size used when streaming uploaded files to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Shared namespace mapping SHA-256 of uploaded file content to its filename.
+# Holds one entry per uploaded document; claims that never reach doc_status are
+# released, and entries of deleted documents are replaced on the next upload of
+# the same content, so it only grows with the number of distinct uploads.
+UPLOAD_HASH_NAMESPACE = "upload_content_hashes"
+
+# Number of file sources looked up concurrently when checking for duplicates,
+# kept small so a large batch does not take over the storage connection pool
+FILE_SOURCE_CHECK_BATCH_SIZE = 8
+
 
 def sanitize_filename(filename: str, input_dir: Path) -> str:
     """
@@ -1430,14 +1444,132 @@ async def pipeline_enqueue_file(
                 logger.error(f"Error deleting file {file_path}: {str(e)}")
 
 
-async def pipeline_index_file(rag: LightRAG, file_path: Path, track_id: str = None):
+async def save_upload_to_temp_file(
+    file: UploadFile, target_dir: Path
+) -> tuple[Path, str]:
+    """Stream an uploaded file into a temporary file and hash its content
+
+    The SHA-256 digest is computed chunk by chunk while writing, so neither the
+    file nor a second read pass is needed to detect duplicate content.
+
+    Args:
+        file: The uploaded file
+        target_dir: Directory to create the temporary file in
+
+    Returns:
+        tuple[Path, str]: Path of the temporary file and hex digest of its content
+    """
+    # The .part suffix keeps the file out of directory scans until it is renamed
+    temp_path = target_dir / f"{temp_prefix}{uuid.uuid4().hex}.part"
+    hasher = hashlib.sha256()
+    try:
+        async with aiofiles.open(temp_path, "wb") as buffer:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+                await buffer.write(chunk)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return temp_path, hasher.hexdigest()
+
+
+def move_upload_into_place(temp_path: Path, file_path: Path) -> bool:
+    """Give a fully written upload its final name unless that name is already taken
+
+    A hard link fails atomically if the target exists, so concurrent uploads
+    with the same filename cannot overwrite each other. Filesystems without hard
+    link support fall back to a check and rename, which involve no await in between.
+
+    Args:
+        temp_path: Temporary file holding the uploaded content
+        file_path: Final path of the upload in the input directory
+
+    Returns:
+        bool: True if the file was moved into place, False if file_path exists
+    """
+    try:
+        file_path.hardlink_to(temp_path)
+    except FileExistsError:
+        return False
+    except OSError:
+        if file_path.exists():
+            return False
+        temp_path.replace(file_path)
+    return True
+
+
+async def claim_upload_content(
+    rag: LightRAG, input_dir: Path, content_hash: str, filename: str
+) -> Optional[str]:
+    """Record an upload's content hash unless the same content was already uploaded
+
+    The hash is claimed with a single setdefault so concurrent uploads of the same
+    content cannot both pass the check. The caller moves the file into place
+    first, so `filename` is owned by this upload and an entry already pointing to
+    it is left over from an earlier upload. An earlier upload only counts as a
+    duplicate while its file is still waiting in the input directory or its
+    document remains in doc_status storage, so content can be uploaded again
+    after the document was deleted.
+
+    Args:
+        rag: LightRAG instance
+        input_dir: Input directory uploads are saved to
+        content_hash: SHA-256 hex digest of the uploaded content
+        filename: Filename the new upload will be saved as
+
+    Returns:
+        Optional[str]: Filename of the existing upload, or None if the hash was
+            claimed for `filename`
+    """
+    from lightrag.kg.shared_storage import get_namespace_data
+
+    upload_hashes = await get_namespace_data(UPLOAD_HASH_NAMESPACE)
+    while True:
+        existing = upload_hashes.setdefault(content_hash, filename)
+        if existing == filename:
+            return None
+
+        if (input_dir / existing).exists() or await rag.doc_status.get_doc_by_file_path(
+            existing
+        ):
+            return existing
+
+        # Stale entry, take it over unless another upload replaced it meanwhile
+        if upload_hashes.get(content_hash) == existing:
+            upload_hashes[content_hash] = filename
+            return None
+
+
+async def release_upload_content(content_hash: str, filename: str) -> None:
+    """Drop a content hash claim that did not lead to an indexed document
+
+    Args:
+        content_hash: SHA-256 hex digest claimed by the upload
+        filename: Filename the upload was saved as
+    """
+    from lightrag.kg.shared_storage import get_namespace_data
+
+    upload_hashes = await get_namespace_data(UPLOAD_HASH_NAMESPACE)
+    if upload_hashes.get(content_hash) == filename:
+        upload_hashes.pop(content_hash, None)
+
+
+async def pipeline_index_file(
+    rag: LightRAG,
+    file_path: Path,
+    track_id: str = None,
+    content_hash: Optional[str] = None,
+):
     """Index a file with track_id
 
     Args:
         rag: LightRAG instance
         file_path: Path to the saved file
         track_id: Optional tracking ID
+        content_hash: Optional content hash claimed by the upload, released if
+            the file never reaches doc_status storage
     """
+    success = False
     try:
         success, returned_track_id = await pipeline_enqueue_file(
             rag, file_path, track_id
@@ -1449,6 +1581,13 @@ async def pipeline_index_file(rag: LightRAG, file_path: Path, track_id: str = No
         logger.error(f"Error indexing file {file_path.name}: {str(e)}")
         logger.error(traceback.format_exc())
 
+    if content_hash and not success:
+        try:
+            if not await rag.doc_status.get_doc_by_file_path(file_path.name):
+                await release_upload_content(content_hash, file_path.name)
+        except Exception as e:
+            logger.error(f"Error releasing content hash of {file_path.name}: {str(e)}")
+
 
 async def pipeline_index_files(
     rag: LightRAG, file_paths: List[Path], track_id: str = None
@@ -1901,13 +2040,44 @@ def create_document_routes(
                     track_id="",
                 )
 
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            # Stream upload to a temporary file while hashing its content
+            temp_path, content_hash = await save_upload_to_temp_file(
+                file, doc_manager.input_dir
+            )
+
+            try:
+                # Another upload may have taken the name while this one was streaming
+                if not move_upload_into_place(temp_path, file_path):
+                    return InsertResponse(
+                        status="duplicated",
+                        message=f"File '{safe_filename}' already exists in the input directory.",
+                        track_id="",
+                    )
+            finally:
+                temp_path.unlink(missing_ok=True)
+
+            try:
+                # Skip re-processing identical content uploaded under another name
+                duplicate_filename = await claim_upload_content(
+                    rag, doc_manager.input_dir, content_hash, safe_filename
+                )
+            except BaseException:
+                file_path.unlink(missing_ok=True)
+                raise
+            if duplicate_filename:
+                file_path.unlink(missing_ok=True)
+                return InsertResponse(
+                    status="duplicated",
+                    message=f"File '{safe_filename}' has the same content as already uploaded file '{duplicate_filename}'.",
+                    track_id="",
+                )
 
             track_id = generate_track_id("upload")
 
             # Add to background tasks and get track_id
-            background_tasks.add_task(pipeline_index_file, rag, file_path, track_id)
+            background_tasks.add_task(
+                pipeline_index_file, rag, file_path, track_id, content_hash
+            )
 
             return InsertResponse(
                 status="success",
@@ -2009,15 +2179,26 @@ def create_document_routes(
         try:
             # Check if any file_sources already exist in doc_status storage
             if request.file_sources:
-                for file_source in request.file_sources:
-                    if (
+                # Look up distinct sources in small concurrent batches, stopping
+                # at the first batch that contains an existing document
+                sources_to_check = list(
+                    dict.fromkeys(
                         file_source
+                        for file_source in request.file_sources
+                        if file_source
                         and file_source.strip()
                         and file_source != "unknown_source"
-                    ):
-                        existing_doc_data = await rag.doc_status.get_doc_by_file_path(
-                            file_source
-                        )
+                    )
+                )
+                for i in range(0, len(sources_to_check), FILE_SOURCE_CHECK_BATCH_SIZE):
+                    batch = sources_to_check[i : i + FILE_SOURCE_CHECK_BATCH_SIZE]
+                    existing_docs = await asyncio.gather(
+                        *[
+                            rag.doc_status.get_doc_by_file_path(file_source)
+                            for file_source in batch
+                        ]
+                    )
+                    for file_source, existing_doc_data in zip(batch, existing_docs):
                         if existing_doc_data:
                             # Get document status information for error message
                             status = existing_doc_data.get("status", "unknown")
@@ -8,7 +8,6 @@ import re
 from enum import Enum
 from fastapi.responses import StreamingResponse
 import asyncio
-from ascii_colors import trace_exception
 from lightrag import LightRAG, QueryParam
 from lightrag.utils import TiktokenTokenizer
 from lightrag.api.utils_api import get_combined_auth_dependency
@@ -418,8 +417,8 @@ class OllamaAPI:
                                 yield f"{json.dumps(data, ensure_ascii=False)}\n"
                                 return
 
-                        except Exception as e:
-                            trace_exception(e)
+                        except Exception:
+                            logger.exception("Error in /api/generate stream")
                             raise
 
                     return StreamingResponse(
@@ -462,7 +461,7 @@ class OllamaAPI:
                         "eval_duration": eval_time,
                     }
             except Exception as e:
-                trace_exception(e)
+                logger.exception("Error processing /api/generate request")
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.router.post(
@@ -666,8 +665,8 @@ class OllamaAPI:
                                 }
                                 yield f"{json.dumps(data, ensure_ascii=False)}\n"
 
-                        except Exception as e:
-                            trace_exception(e)
+                        except Exception:
+                            logger.exception("Error in /api/chat stream")
                             raise
 
                     return StreamingResponse(
@@ -730,5 +729,5 @@ class OllamaAPI:
                         "eval_duration": eval_time,
                     }
             except Exception as e:
-                trace_exception(e)
+                logger.exception("Error processing /api/chat request")
                 raise HTTPException(status_code=500, detail=str(e))
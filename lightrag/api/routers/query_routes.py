@@ -11,7 +11,7 @@ from lightrag.base import QueryParam
 from lightrag.api.utils_api import get_combined_auth_dependency
 from pydantic import BaseModel, Field, field_validator
 
-from ascii_colors import trace_exception
+from lightrag.utils import logger
 
 router = APIRouter(tags=["query"])
 
@@ -140,10 +140,9 @@ class QueryRequest(BaseModel):
             exclude_none=True, exclude={"query", "include_chunk_content"}
         )
 
-        # Ensure `mode` and `stream` are set explicitly
-        param = QueryParam(**request_data)
-        param.stream = is_stream
-        return param
+        # Set `stream` before construction so QueryParam is built in a single pass
+        request_data["stream"] = is_stream
+        return QueryParam(**request_data)
 
 
 class ReferenceItem(BaseModel):
@@ -405,11 +404,8 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
                 - 500: Internal processing error (e.g., LLM service unavailable)
         """
         try:
-            param = request.to_query_params(
-                False
-            )  # Ensure stream=False for non-streaming endpoint
-            # Force stream=False for /query endpoint regardless of include_references setting
-            param.stream = False
+            # Force stream=False for /query endpoint regardless of request settings
+            param = request.to_query_params(False)
 
             # Unified approach: always use aquery_llm for both cases
             result = await rag.aquery_llm(request.query, param=param)
@@ -453,7 +449,7 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
             else:
                 return QueryResponse(response=response_content, references=None)
         except Exception as e:
-            trace_exception(e)
+            logger.exception("Error processing /query request")
             raise HTTPException(status_code=500, detail=str(e))
 
     @router.post(
@@ -739,7 +735,7 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
                 },
             )
         except Exception as e:
-            trace_exception(e)
+            logger.exception("Error processing /query/stream request")
             raise HTTPException(status_code=500, detail=str(e))
 
     @router.post(
@@ -1156,7 +1152,7 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
                     data={},
                 )
         except Exception as e:
-            trace_exception(e)
+            logger.exception("Error processing /query/data request")
             raise HTTPException(status_code=500, detail=str(e))
 
     return router
@@ -86,10 +86,13 @@ DEFAULT_TEMPERATURE = 1.0
 # Async configuration defaults
 DEFAULT_MAX_ASYNC = 4  # Default maximum async operations
 DEFAULT_MAX_PARALLEL_INSERT = 2  # Default maximum parallel insert operations
+DEFAULT_LLM_RPS = 0  # Default max LLM requests started per second (0 means unlimited)
 
 # Embedding configuration defaults
 DEFAULT_EMBEDDING_FUNC_MAX_ASYNC = 8  # Default max async for embedding functions
 DEFAULT_EMBEDDING_BATCH_NUM = 10  # Default batch size for embedding computations
+DEFAULT_EMBEDDING_COALESCE_WINDOW_MS = 0  # Embedding coalescing window (0 disables)
+DEFAULT_EMBEDDING_COALESCE_MAX_BATCH = 64  # Max texts per coalesced embedding request
 
 # Gunicorn worker timeout
 DEFAULT_TIMEOUT = 300
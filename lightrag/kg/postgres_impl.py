@@ -62,6 +62,12 @@ class PostgreSQLDB:
         self.database = config["database"]
         self.workspace = config["workspace"]
         self.max = int(config["max_connections"])
+        # Keep a warm floor of connections so requests skip connection setup
+        self.min = min(int(config.get("min_connections", 1)), self.max)
+        self.connection_timeout = float(config.get("connection_timeout", 60.0))
+        self.max_inactive_connection_lifetime = float(
+            config.get("max_inactive_connection_lifetime", 300.0)
+        )
         self.increment = 1
         self.pool: Pool | None = None
 
@@ -197,8 +203,10 @@ class PostgreSQLDB:
             "database": self.database,
             "host": self.host,
             "port": self.port,
-            "min_size": 1,
+            "min_size": self.min,
             "max_size": self.max,
+            "timeout": self.connection_timeout,
+            "max_inactive_connection_lifetime": self.max_inactive_connection_lifetime,
         }
 
         # Only add statement_cache_size if it's configured
@@ -1553,6 +1561,20 @@ class ClientManager:
                 "POSTGRES_MAX_CONNECTIONS",
                 config.get("postgres", "max_connections", fallback=50),
             ),
+            "min_connections": os.environ.get(
+                "POSTGRES_MIN_CONNECTIONS",
+                config.get("postgres", "min_connections", fallback=1),
+            ),
+            "connection_timeout": os.environ.get(
+                "POSTGRES_CONNECTION_TIMEOUT",
+                config.get("postgres", "connection_timeout", fallback=60.0),
+            ),
+            "max_inactive_connection_lifetime": os.environ.get(
+                "POSTGRES_MAX_INACTIVE_CONNECTION_LIFETIME",
+                config.get(
+                    "postgres", "max_inactive_connection_lifetime", fallback=300.0
+                ),
+            ),
             # SSL configuration
             "ssl_mode": os.environ.get(
                 "POSTGRES_SSL_MODE",
@@ -379,6 +379,110 @@ class EmbeddingFunc:
         return await self.func(*args, **kwargs)
 
 
+class EmbeddingBatcher:
+    """Coalesce concurrent embedding calls into shared upstream requests
+
+    Calls arriving within `flush_interval` seconds of each other are merged,
+    sorted by text length, and sent to the wrapped function in batches of at
+    most `max_batch_size` texts. Each caller receives its own slice of the
+    resulting embedding matrix in the original order.
+
+    Args:
+        func: Async embedding function accepting `(texts, embedding_dim=None)`
+        max_batch_size: Maximum number of texts sent in a single upstream request
+        flush_interval: Time window in seconds used to collect concurrent calls
+    """
+
+    def __init__(self, func: Callable, max_batch_size: int, flush_interval: float):
+        self.func = func
+        self.max_batch_size = max(1, max_batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        # embedding_dim -> list of (texts, future) waiting for the next flush
+        self._pending: dict[Any, list[tuple[list[str], asyncio.Future]]] = {}
+        self._pending_sizes: dict[Any, int] = {}
+        self._flush_handles: dict[Any, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def __call__(self, texts: list[str], embedding_dim: int | None = None):
+        texts = list(texts)
+        # Large requests gain nothing from coalescing, send them directly
+        if not texts or len(texts) >= self.max_batch_size:
+            return await self.func(texts, embedding_dim=embedding_dim)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(embedding_dim, []).append((texts, future))
+        self._pending_sizes[embedding_dim] = self._pending_sizes.get(
+            embedding_dim, 0
+        ) + len(texts)
+
+        if self._pending_sizes[embedding_dim] >= self.max_batch_size:
+            self._flush(embedding_dim)
+        elif embedding_dim not in self._flush_handles:
+            self._flush_handles[embedding_dim] = loop.call_later(
+                self.flush_interval, self._flush, embedding_dim
+            )
+
+        return await future
+
+    def _flush(self, embedding_dim: int | None) -> None:
+        handle = self._flush_handles.pop(embedding_dim, None)
+        if handle is not None:
+            handle.cancel()
+        items = self._pending.pop(embedding_dim, [])
+        self._pending_sizes.pop(embedding_dim, None)
+        if not items:
+            return
+
+        task = asyncio.create_task(self._run_batch(items, embedding_dim))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self,
+        items: list[tuple[list[str], asyncio.Future]],
+        embedding_dim: int | None,
+    ) -> None:
+        # Flatten all texts and sort by length so each batch has similar sizes
+        flat_texts = [text for texts, _ in items for text in texts]
+        order = sorted(range(len(flat_texts)), key=lambda i: len(flat_texts[i]))
+
+        try:
+            batches = [
+                order[i : i + self.max_batch_size]
+                for i in range(0, len(order), self.max_batch_size)
+            ]
+            results = await asyncio.gather(
+                *[
+                    self.func(
+                        [flat_texts[i] for i in batch], embedding_dim=embedding_dim
+                    )
+                    for batch in batches
+                ]
+            )
+            sorted_embeddings = np.concatenate(
+                [np.asarray(result) for result in results]
+            )
+            # Restore original order before scattering results back to callers
+            embeddings = np.empty_like(sorted_embeddings)
+            embeddings[order] = sorted_embeddings
+        except asyncio.CancelledError:
+            for _, future in items:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for texts, future in items:
+            if not future.done():
+                future.set_result(embeddings[offset : offset + len(texts)])
+            offset += len(texts)
+
+
 def compute_args_hash(*args: Any) -> str:
     """Compute a hash for the given arguments with safe Unicode handling.
 
@@ -910,6 +1014,52 @@ def priority_limit_async_func_call(
     return final_decro
 
 
+def rate_limit_async_func_call(max_rate: float, burst: int = 1):
+    """
+    Token bucket rate limiter for asynchronous functions
+
+    Complements priority_limit_async_func_call for providers that enforce a
+    requests-per-second quota rather than a concurrency limit. Callers wait in
+    FIFO order until a token is available.
+
+    Args:
+        max_rate: Maximum number of calls started per second
+        burst: Maximum number of calls that may start back-to-back after idle time
+
+    Returns:
+        Decorator function
+    """
+    if max_rate <= 0:
+        raise ValueError(f"max_rate must be positive, got {max_rate}")
+    burst = max(1, burst)
+
+    def final_decro(func):
+        lock = asyncio.Lock()
+        tokens = float(burst)
+        last_refill = time.monotonic()
+
+        async def acquire():
+            nonlocal tokens, last_refill
+            async with lock:
+                while True:
+                    now = time.monotonic()
+                    tokens = min(burst, tokens + (now - last_refill) * max_rate)
+                    last_refill = now
+                    if tokens >= 1:
+                        tokens -= 1
+                        return
+                    await asyncio.sleep((1 - tokens) / max_rate)
+
+        @wraps(func)
+        async def wait_func(*args, **kwargs):
+            await acquire()
+            return await func(*args, **kwargs)
+
+        return wait_func
+
+    return final_decro
+
+
 def wrap_embedding_func_with_attrs(**kwargs):
     """Wrap a function with attributes"""
 
@@ -0,0 +1,90 @@
+"""
+Unit tests for EmbeddingBatcher, which coalesces concurrent embedding calls.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from lightrag.utils import EmbeddingBatcher
+
+
+class RecordingEmbed:
+    """Fake embedding function returning one row per text: [len(text), id]."""
+
+    def __init__(self, fail: bool = False):
+        self.calls: list[list[str]] = []
+        self.fail = fail
+
+    async def __call__(self, texts, embedding_dim=None):
+        self.calls.append(list(texts))
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("upstream failure")
+        return np.array([[len(t), int(t.split("-")[1])] for t in texts], dtype=float)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_merged_into_one_flush():
+    embed = RecordingEmbed()
+    batcher = EmbeddingBatcher(embed, max_batch_size=64, flush_interval=0.01)
+
+    results = await asyncio.gather(
+        batcher(["a-0", "bb-1"]),
+        batcher(["ccc-2"]),
+        batcher(["dddd-3", "e-4"]),
+    )
+
+    assert len(embed.calls) == 1
+    assert sorted(embed.calls[0]) == sorted(["a-0", "bb-1", "ccc-2", "dddd-3", "e-4"])
+    assert [r.shape[0] for r in results] == [2, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_each_caller_gets_own_rows_in_input_order():
+    embed = RecordingEmbed()
+    batcher = EmbeddingBatcher(embed, max_batch_size=3, flush_interval=0.01)
+
+    # Longest texts first so the length sort reorders them across batches
+    first, second = await asyncio.gather(
+        batcher(["xxxxxx-0", "y-1"]),
+        batcher(["zzzz-2", "w-3"]),
+    )
+
+    # Upstream calls were sent sorted by length and split by max_batch_size
+    sent = [t for call in embed.calls for t in call]
+    assert [len(t) for t in sent] == sorted(len(t) for t in sent)
+    assert all(len(call) <= 3 for call in embed.calls)
+
+    assert first[:, 1].tolist() == [0, 1]
+    assert second[:, 1].tolist() == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_upstream_failure_is_raised_in_every_caller():
+    embed = RecordingEmbed(fail=True)
+    batcher = EmbeddingBatcher(embed, max_batch_size=64, flush_interval=0.01)
+
+    results = await asyncio.gather(
+        batcher(["a-0"]), batcher(["b-1"]), return_exceptions=True
+    )
+
+    assert len(embed.calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_break_others():
+    embed = RecordingEmbed()
+    batcher = EmbeddingBatcher(embed, max_batch_size=64, flush_interval=0.05)
+
+    cancelled = asyncio.create_task(batcher(["a-0"]))
+    kept = asyncio.create_task(batcher(["bb-1", "c-2"]))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    result = await kept
+    assert result[:, 1].tolist() == [1, 2]
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
@@ -0,0 +1,54 @@
+"""
+Unit tests for the rate_limit_async_func_call token bucket.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from lightrag.utils import rate_limit_async_func_call
+
+
+def make_recorder(max_rate: float, burst: int = 1):
+    starts: list[float] = []
+
+    @rate_limit_async_func_call(max_rate, burst=burst)
+    async def call():
+        starts.append(time.monotonic())
+
+    return call, starts
+
+
+@pytest.mark.asyncio
+async def test_burst_calls_start_immediately():
+    call, starts = make_recorder(max_rate=5, burst=3)
+    begin = time.monotonic()
+
+    await asyncio.gather(*[call() for _ in range(4)])
+
+    # The first `burst` calls do not wait for a token
+    assert all(s - begin < 0.05 for s in starts[:3])
+    # The next call waits for a refill at 5 calls per second
+    assert starts[3] - begin >= 0.2 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_steady_state_rate_does_not_exceed_max_rate():
+    max_rate = 50
+    calls = 11
+    call, starts = make_recorder(max_rate=max_rate)
+
+    await asyncio.gather(*[call() for _ in range(calls)])
+
+    assert len(starts) == calls
+    elapsed = starts[-1] - starts[0]
+    # With burst=1, n calls need at least (n - 1) / max_rate seconds
+    assert elapsed >= (calls - 1) / max_rate * 0.9
+    assert (calls - 1) / elapsed <= max_rate * 1.1
+
+
+@pytest.mark.parametrize("max_rate", [0, -1])
+def test_non_positive_max_rate_raises(max_rate):
+    with pytest.raises(ValueError):
+        rate_limit_async_func_call(max_rate)
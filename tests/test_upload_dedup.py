@@ -0,0 +1,165 @@
+"""
+Tests for deduplication of /documents/upload by filename and content hash.
+"""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from lightrag.kg.shared_storage import (
+    finalize_share_data,
+    get_namespace_data,
+    initialize_share_data,
+)
+
+# The routers import the server config, which parses sys.argv at import time
+with patch.object(sys, "argv", ["lightrag-server"]):
+    from lightrag.api.routers import document_routes
+    from lightrag.api.routers.document_routes import (
+        DocumentManager,
+        UPLOAD_HASH_NAMESPACE,
+        claim_upload_content,
+        create_document_routes,
+        pipeline_index_file,
+    )
+
+
+class FakeDocStatus:
+    def __init__(self):
+        self.docs: dict[str, dict] = {}
+
+    async def get_doc_by_file_path(self, file_path):
+        await asyncio.sleep(0)
+        return self.docs.get(file_path)
+
+
+@pytest.fixture
+def rag():
+    initialize_share_data()
+    yield SimpleNamespace(doc_status=FakeDocStatus())
+    finalize_share_data()
+
+
+@pytest.mark.asyncio
+async def test_same_content_under_new_name_is_duplicate(rag, tmp_path):
+    (tmp_path / "a.txt").write_text("content")
+    assert await claim_upload_content(rag, tmp_path, "hash-a", "a.txt") is None
+
+    assert await claim_upload_content(rag, tmp_path, "hash-a", "b.txt") == "a.txt"
+
+    # Still a duplicate once the file has been moved out for indexing
+    (tmp_path / "a.txt").unlink()
+    rag.doc_status.docs["a.txt"] = {"status": "processed"}
+    assert await claim_upload_content(rag, tmp_path, "hash-a", "b.txt") == "a.txt"
+
+
+@pytest.mark.asyncio
+async def test_reupload_after_document_deleted(rag, tmp_path):
+    assert await claim_upload_content(rag, tmp_path, "hash-a", "a.txt") is None
+    rag.doc_status.docs["a.txt"] = {"status": "processed"}
+
+    # Deleting the document removes it from doc_status storage
+    del rag.doc_status.docs["a.txt"]
+
+    (tmp_path / "b.txt").write_text("content")
+    assert await claim_upload_content(rag, tmp_path, "hash-a", "b.txt") is None
+    assert await claim_upload_content(rag, tmp_path, "hash-a", "c.txt") == "b.txt"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_uploads_of_same_content_claim_once(rag, tmp_path):
+    async def upload(name):
+        # Mirrors the endpoint, which moves the file into place before claiming
+        (tmp_path / name).write_text("content")
+        duplicate = await claim_upload_content(rag, tmp_path, "hash-a", name)
+        if duplicate is not None:
+            (tmp_path / name).unlink()
+        return duplicate
+
+    results = await asyncio.gather(*[upload(f"{i}.txt") for i in range(5)])
+
+    claimed = [r for r in results if r is None]
+    assert len(claimed) == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("recorded", [False, True])
+async def test_claim_released_when_indexing_never_records_file(rag, tmp_path, recorded):
+    (tmp_path / "a.txt").write_text("content")
+    assert await claim_upload_content(rag, tmp_path, "hash-a", "a.txt") is None
+    if recorded:
+        # Failed extraction is recorded as an error document in doc_status
+        rag.doc_status.docs["a.txt"] = {"status": "failed"}
+
+    async def failed_enqueue(rag, file_path, track_id=None):
+        return False, track_id
+
+    with patch.object(document_routes, "pipeline_enqueue_file", failed_enqueue):
+        await pipeline_index_file(rag, tmp_path / "a.txt", "track", "hash-a")
+
+    upload_hashes = await get_namespace_data(UPLOAD_HASH_NAMESPACE)
+    assert ("hash-a" in upload_hashes) is recorded
+
+
+@pytest.fixture
+def upload_client(rag, tmp_path):
+    indexed = []
+
+    async def record_index(rag, file_path, track_id=None, content_hash=None):
+        indexed.append(file_path.name)
+
+    save_upload = document_routes.save_upload_to_temp_file
+
+    async def slow_save_upload(file, target_dir):
+        # Let concurrent uploads pass the early filename check before either finishes
+        result = await save_upload(file, target_dir)
+        await asyncio.sleep(0.05)
+        return result
+
+    app = FastAPI()
+    app.include_router(create_document_routes(rag, DocumentManager(str(tmp_path))))
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    )
+    with (
+        patch.object(document_routes, "pipeline_index_file", record_index),
+        patch.object(document_routes, "save_upload_to_temp_file", slow_save_upload),
+    ):
+        yield client, indexed
+
+
+async def upload_file(client, name, content):
+    response = await client.post(
+        "/documents/upload", files={"file": (name, content, "text/plain")}
+    )
+    assert response.status_code == 200
+    return response.json()["status"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_uploads_of_same_name(upload_client, tmp_path):
+    # The document router is module level, so both cases share one app
+    client, indexed = upload_client
+
+    for name, contents in [
+        ("same.txt", [b"same content", b"same content"]),
+        ("different.txt", [b"first content", b"second content"]),
+    ]:
+        statuses = await asyncio.gather(
+            *[upload_file(client, name, content) for content in contents]
+        )
+
+        assert sorted(statuses) == ["duplicated", "success"]
+        assert indexed.count(name) == 1
+        # The accepted upload is not overwritten by the rejected one
+        accepted = contents[statuses.index("success")]
+        assert (tmp_path / name).read_bytes() == accepted
+
+    # No temporary files are left behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["different.txt", "same.txt"]